@@ -1,7 +1,28 @@
+const https = require('https');
 const { google } = require('googleapis');
 
 const SHEET_ID = '1_Z9hvD6GvNEn0LcD60Ajwh8NWLm07Xp_b4Aqub1G3os';
 
+// Reused across warm invocations; GoogleAuth caches and refreshes the access token itself.
+let sheetsClient;
+
+// Keep the TLS connection to the Sheets API open between warm invocations.
+const agent = new https.Agent({ keepAlive: true });
+
+function getSheets() {
+  if (!sheetsClient) {
+    const credentials = JSON.parse(process.env.GOOGLE_CREDENTIALS);
+
+    const auth = new google.auth.GoogleAuth({
+      credentials: credentials,
+      scopes: ['https://www.googleapis.com/auth/spreadsheets']
+    });
+
+    sheetsClient = google.sheets({ version: 'v4', auth, agent });
+  }
+  return sheetsClient;
+}
+
 exports.handler = async (event) => {
   if (event.httpMethod !== 'POST') {
     return {
@@ -14,14 +35,7 @@ exports.handler = async (event) => {
     const data = JSON.parse(event.body);
     const { email, produits, montant, idTransaction, modePaiement } = data;
 
-    const credentials = JSON.parse(process.env.GOOGLE_CREDENTIALS);
-    
-    const auth = new google.auth.GoogleAuth({
-      credentials: credentials,
-      scopes: ['https://www.googleapis.com/auth/spreadsheets']
-    });
-
-    const sheets = google.sheets({ version: 'v4', auth });
+    const sheets = getSheets();
 
     const now = new Date().toISOString();
     const newRow = [